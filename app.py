@@ -1,12 +1,11 @@
 from flask import Flask, request, jsonify
-import joblib
-import pandas as pd
+from graph_runtime import load_graph
 
 # Initialize Flask app
 app = Flask(__name__)
 
-# Load trained model
-model = joblib.load("salary_prediction_model.pkl")
+# Load exported inference graph (see export_model.py)
+model = load_graph("salary_prediction_model.json")
 
 @app.route("/health", methods=["GET"])
 def health():
@@ -22,11 +21,8 @@ def predict():
         if not all(field in data for field in required_fields):
             return jsonify({"error": "Missing required fields"}), 400
 
-        # Convert input to DataFrame
-        sample_df = pd.DataFrame([data])
-
         # Predict
-        prediction = model.predict(sample_df)[0]
+        prediction = model.predict([data])[0]
 
         return jsonify({
             "predicted_salary": round(float(prediction), 2)
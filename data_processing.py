@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder
@@ -5,16 +6,7 @@ from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.impute import SimpleImputer
 
-def load_and_process_data(file_path):
-    df = pd.read_csv(file_path)
-
-    # Drop rows where target is missing
-    df = df.dropna(subset=["Salary"])
-
-    # Separate features and target
-    X = df.drop("Salary", axis=1)
-    y = df["Salary"]
-
+def build_preprocessor():
     # Columns
     categorical_low = ["Gender", "Education Level"]  # one-hot
     categorical_high = ["Job Title"]                 # ordinal encoding
@@ -44,9 +36,35 @@ def load_and_process_data(file_path):
         ]
     )
 
+    return preprocessor
+
+def _no_stage(name):
+    return nullcontext()
+
+def load_dataset(file_path, stage=_no_stage):
+    # stage(name) returns a context manager wrapping each step, e.g. StageProfiler.stage
+    with stage("data.read_csv"):
+        df = pd.read_csv(file_path)
+
+    # Drop rows where target is missing
+    with stage("data.dropna"):
+        df = df.dropna(subset=["Salary"])
+
+    # Separate features and target
+    X = df.drop("Salary", axis=1)
+    y = df["Salary"]
+
+    return X, y
+
+def load_and_process_data(file_path, stage=_no_stage):
+    X, y = load_dataset(file_path, stage)
+
+    preprocessor = build_preprocessor()
+
     # Train-test split
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
+    with stage("data.train_test_split"):
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42
+        )
 
     return X_train, X_test, y_train, y_test, preprocessor
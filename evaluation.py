@@ -0,0 +1,271 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+import pandas as pd
+import joblib
+from sklearn.base import clone
+from sklearn.model_selection import KFold
+from data_processing import load_dataset
+
+SEGMENT_COLUMNS = ["Education Level", "Job Title"]
+
+# Set once per worker process by _init_worker so tasks only carry seeds
+_pipeline = None
+_X = None
+_y = None
+
+
+def _init_worker(pipeline, X, y):
+    global _pipeline, _X, _y
+    _pipeline, _X, _y = pipeline, X, y
+
+
+def _fit_predict(train_idx, test_idx):
+    model = clone(_pipeline)
+    model.fit(_X.iloc[train_idx], _y.iloc[train_idx])
+    return model.predict(_X.iloc[test_idx])
+
+
+def _kfold_task(args):
+    """One repeat of K-fold: out-of-fold predictions for every row."""
+    seed, n_splits = args
+    kfold = KFold(n_splits=n_splits, shuffle=True, random_state=seed)
+    idx = []
+    preds = []
+    for train_idx, test_idx in kfold.split(_X):
+        idx.append(test_idx)
+        preds.append(_fit_predict(train_idx, test_idx))
+    return np.concatenate(idx), np.concatenate(preds)
+
+
+def _bootstrap_task(args):
+    """One bootstrap replicate: fit on a resample, predict the out-of-bag rows."""
+    seed, _ = args
+    rng = np.random.default_rng(seed)
+    n = len(_X)
+    train_idx = rng.integers(0, n, size=n)
+    oob = np.ones(n, dtype=bool)
+    oob[train_idx] = False
+    test_idx = np.flatnonzero(oob)
+    return test_idx, _fit_predict(train_idx, test_idx)
+
+
+def _task_seeds(seed, n):
+    """Independent per-task seeds, so results do not depend on the worker count."""
+    return [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(n)]
+
+
+def run_resamples(pipeline, X, y, kind, n_resamples, n_splits=5, seed=42, n_workers=None):
+    """Run resamples in a process pool.
+
+    Returns flat arrays (resample_id, row_index, prediction) covering every
+    held-out prediction of every resample, ordered by resample.
+    """
+    task = _kfold_task if kind == "kfold" else _bootstrap_task
+    args = [(s, n_splits) for s in _task_seeds(seed, n_resamples)]
+
+    if n_workers == 1:
+        _init_worker(pipeline, X, y)
+        results = [task(a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(pipeline, X, y)) as executor:
+            results = list(executor.map(task, args))
+
+    resample_id = np.concatenate([np.full(len(idx), i) for i, (idx, _) in enumerate(results)])
+    row_index = np.concatenate([idx for idx, _ in results])
+    preds = np.concatenate([p for _, p in results])
+    return resample_id, row_index, preds
+
+
+def grouped_metrics(group, y_true, y_pred, n_groups):
+    """RMSE and R2 for every group at once using bincount; NaN for empty groups."""
+    count = np.bincount(group, minlength=n_groups)
+    sse = np.bincount(group, weights=(y_true - y_pred) ** 2, minlength=n_groups)
+    y_sum = np.bincount(group, weights=y_true, minlength=n_groups)
+    y_sq = np.bincount(group, weights=y_true ** 2, minlength=n_groups)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rmse = np.sqrt(sse / count)
+        sst = y_sq - y_sum ** 2 / count
+        r2 = 1 - sse / sst
+    return rmse, r2, count
+
+
+def confidence_interval(values, confidence):
+    alpha = (1 - confidence) / 2
+    low, high = np.nanpercentile(values, [100 * alpha, 100 * (1 - alpha)])
+    return {"mean": float(np.nanmean(values)), "low": float(low), "high": float(high)}
+
+
+def spread(values):
+    """Mean, min and max across resamples (no coverage claim)."""
+    return {"mean": float(np.nanmean(values)), "min": float(np.nanmin(values)), "max": float(np.nanmax(values))}
+
+
+def row_bootstrap_interval(y, row_index, preds, confidence, seed, n_resamples=1000, max_elements=2000000):
+    """Confidence interval for pooled K-fold RMSE/R2 by resampling rows.
+
+    Every repeat predicts each row once, so squared errors are first averaged
+    per row across repeats; rows are then resampled with replacement, a batch
+    of resamples at a time. Batches hold at most max_elements rows in total,
+    so memory stays bounded however large the dataset is.
+    """
+    y = y.to_numpy(dtype=np.float64)
+    n = len(y)
+    sq_err = (np.bincount(row_index, weights=(y[row_index] - preds) ** 2, minlength=n)
+              / np.bincount(row_index, minlength=n))
+
+    rng = np.random.default_rng(seed)
+    batch_size = max(1, max_elements // n)
+    rmse = []
+    r2 = []
+    for start in range(0, n_resamples, batch_size):
+        idx = rng.integers(0, n, size=(min(batch_size, n_resamples - start), n))
+        sse = sq_err[idx].sum(axis=1)
+        y_b = y[idx]
+        sst = ((y_b - y_b.mean(axis=1, keepdims=True)) ** 2).sum(axis=1)
+        rmse.append(np.sqrt(sse / n))
+        r2.append(1 - sse / sst)
+    return {
+        "rmse": confidence_interval(np.concatenate(rmse), confidence),
+        "r2": confidence_interval(np.concatenate(r2), confidence),
+    }
+
+
+def summarize(X, y, resample_id, row_index, preds, n_resamples, interval, min_segment_rows=10):
+    """Per-resample RMSE/R2 and per-segment RMSE, each reduced with interval(values).
+
+    Segments with fewer than min_segment_rows rows in the dataset are left
+    out (and counted) since their errors rest on a handful of predictions.
+    """
+    y_true = y.to_numpy(dtype=np.float64)[row_index]
+    rmse, r2, _ = grouped_metrics(resample_id, y_true, preds, n_resamples)
+
+    summary = {
+        "rmse": interval(rmse),
+        "r2": interval(r2),
+        "segments": {},
+        "small_segments_skipped": {},
+        "min_segment_rows": min_segment_rows,
+    }
+
+    for column in SEGMENT_COLUMNS:
+        codes, labels = pd.factorize(X[column].fillna("Unknown"))
+        n_seg = len(labels)
+        seg_rows = np.bincount(codes, minlength=n_seg)
+        # One group per (resample, segment) pair
+        group = resample_id * n_seg + codes[row_index]
+        seg_rmse, _, seg_count = grouped_metrics(group, y_true, preds, n_resamples * n_seg)
+        seg_rmse = seg_rmse.reshape(n_resamples, n_seg)
+        seg_count = seg_count.reshape(n_resamples, n_seg)
+
+        segments = []
+        skipped = 0
+        for j, label in enumerate(labels):
+            if seg_count[:, j].sum() == 0:
+                continue
+            if seg_rows[j] < min_segment_rows:
+                skipped += 1
+                continue
+            entry = interval(seg_rmse[:, j])
+            entry["segment"] = str(label)
+            entry["n_rows"] = int(seg_rows[j])
+            entry["n_predictions"] = int(seg_count[:, j].sum())
+            segments.append(entry)
+        summary["segments"][column] = sorted(segments, key=lambda s: s["mean"], reverse=True)
+        summary["small_segments_skipped"][column] = skipped
+
+    return summary
+
+
+def evaluate_model(model_path="salary_prediction_model.pkl", file_path="Salary_Data.csv",
+                   n_repeats=5, n_splits=5, n_bootstrap=50, seed=42, n_workers=None,
+                   confidence=0.95, min_segment_rows=10):
+    """Repeated K-fold and out-of-bag bootstrap evaluation of a saved pipeline.
+
+    Bootstrap metrics get percentile confidence intervals across resamples.
+    K-fold repeats only differ in how rows are split, so their per-repeat
+    values are reported as a spread; the K-fold confidence interval comes from
+    resampling rows of the out-of-fold errors instead.
+    """
+    pipeline = joblib.load(model_path)
+    X, y = load_dataset(file_path)
+    X = X.reset_index(drop=True)
+    y = y.reset_index(drop=True)
+
+    report = {
+        "model_path": model_path,
+        "data_file": file_path,
+        "n_rows": len(X),
+        "seed": seed,
+        "confidence": confidence,
+    }
+    if n_repeats:
+        resamples = run_resamples(pipeline, X, y, "kfold", n_repeats, n_splits, seed, n_workers)
+        kfold = summarize(X, y, *resamples, n_repeats, spread, min_segment_rows)
+        kfold["repeat_spread"] = {"rmse": kfold.pop("rmse"), "r2": kfold.pop("r2")}
+        kfold.update(row_bootstrap_interval(y, resamples[1], resamples[2], confidence, seed))
+        kfold.update({"n_repeats": n_repeats, "n_splits": n_splits})
+        report["kfold"] = kfold
+    if n_bootstrap:
+        resamples = run_resamples(pipeline, X, y, "bootstrap", n_bootstrap, seed=seed, n_workers=n_workers)
+        interval = partial(confidence_interval, confidence=confidence)
+        report["bootstrap"] = summarize(X, y, *resamples, n_bootstrap, interval, min_segment_rows)
+        report["bootstrap"]["n_resamples"] = n_bootstrap
+    return report
+
+
+def _format_range(entry, fmt):
+    if "low" in entry:
+        return f"[{entry['low']:{fmt}}, {entry['high']:{fmt}}]"
+    return f"(spread {entry['min']:{fmt}} to {entry['max']:{fmt}})"
+
+
+def print_report(report, top=5):
+    pct = int(report["confidence"] * 100)
+    for kind in ("kfold", "bootstrap"):
+        if kind not in report:
+            continue
+        result = report[kind]
+        print(f"📊 {kind} evaluation ({pct}% CI)")
+        print(f"   RMSE: {result['rmse']['mean']:.2f} {_format_range(result['rmse'], '.2f')}")
+        print(f"   R2 Score: {result['r2']['mean']:.3f} {_format_range(result['r2'], '.3f')}")
+        if "repeat_spread" in result:
+            repeats = result["repeat_spread"]
+            print(f"   Across {result['n_repeats']} repeats: RMSE {_format_range(repeats['rmse'], '.2f')}, "
+                  f"R2 {_format_range(repeats['r2'], '.3f')}")
+        for column, segments in result["segments"].items():
+            skipped = result["small_segments_skipped"][column]
+            print(f"   Worst {column} segments by RMSE "
+                  f"({skipped} with < {result['min_segment_rows']} rows skipped):")
+            for s in segments[:top]:
+                print(f"      {s['segment']:<32} {s['mean']:>10.2f} {_format_range(s, '.2f')}  "
+                      f"n_predictions={s['n_predictions']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate the saved model with repeated K-fold and bootstrap.")
+    parser.add_argument("--model-path", default="salary_prediction_model.pkl", help="Saved pipeline to evaluate")
+    parser.add_argument("--data", default="Salary_Data.csv", help="Evaluation CSV file")
+    parser.add_argument("--repeats", type=int, default=5, help="K-fold repeats (0 to skip)")
+    parser.add_argument("--folds", type=int, default=5, help="Folds per repeat")
+    parser.add_argument("--bootstrap", type=int, default=50, help="Bootstrap resamples (0 to skip)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--min-segment-rows", type=int, default=10,
+                        help="Leave out segments with fewer rows than this")
+    parser.add_argument("-o", "--output", help="Write the full report as JSON")
+    args = parser.parse_args()
+
+    report = evaluate_model(args.model_path, args.data, args.repeats, args.folds, args.bootstrap,
+                            args.seed, args.workers, args.confidence, args.min_segment_rows)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Evaluation report written to {args.output}")
@@ -0,0 +1,122 @@
+import argparse
+import json
+import sys
+import numpy as np
+import joblib
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder
+from data_processing import load_dataset
+from graph_runtime import GRAPH_FORMAT, GRAPH_VERSION, GraphModel
+
+# The runtime loops over records in Python, so trainers check parity on a capped sample
+PARITY_SAMPLE_ROWS = 10000
+
+
+def _plain(values):
+    """numpy scalars/arrays -> JSON-serializable Python values."""
+    return [v.item() if hasattr(v, "item") else v for v in values]
+
+
+def _check_no_infrequent(step):
+    # Infrequent-category grouping is not implemented by the runtime
+    if step.min_frequency is not None or step.max_categories is not None:
+        raise ValueError(f"{type(step).__name__} with min_frequency/max_categories cannot be exported")
+
+
+def _export_step(step):
+    if isinstance(step, SimpleImputer):
+        if not (isinstance(step.missing_values, float) and np.isnan(step.missing_values)):
+            raise ValueError("Only SimpleImputer(missing_values=np.nan) can be exported")
+        dtype = "float" if np.issubdtype(step.statistics_.dtype, np.number) else "category"
+        return {"op": "Impute", "dtype": dtype, "values": _plain(step.statistics_)}
+    if isinstance(step, OneHotEncoder):
+        if step.drop is not None or step.handle_unknown != "ignore":
+            raise ValueError("Only OneHotEncoder(drop=None, handle_unknown='ignore') can be exported")
+        _check_no_infrequent(step)
+        return {"op": "OneHot", "categories": [_plain(c) for c in step.categories_]}
+    if isinstance(step, OrdinalEncoder):
+        if step.handle_unknown != "use_encoded_value":
+            # The runtime cannot raise on unknown categories the way sklearn does
+            raise ValueError("Only OrdinalEncoder(handle_unknown='use_encoded_value') can be exported")
+        _check_no_infrequent(step)
+        if not (isinstance(step.encoded_missing_value, float) and np.isnan(step.encoded_missing_value)):
+            raise ValueError("Only OrdinalEncoder(encoded_missing_value=np.nan) can be exported")
+        return {"op": "Ordinal", "categories": [_plain(c) for c in step.categories_],
+                "unknown_value": float(step.unknown_value)}
+    raise ValueError(f"Cannot export step of type {type(step).__name__}")
+
+
+def export_pipeline(clf):
+    """Convert a fitted preprocessor + LinearRegression pipeline into a graph dict."""
+    preprocessor = clf.named_steps["preprocessor"]
+    model = clf.named_steps["model"]
+    if not isinstance(preprocessor, ColumnTransformer) or preprocessor.remainder != "drop":
+        raise ValueError("The preprocessor must be a ColumnTransformer with remainder='drop'")
+    if not isinstance(model, LinearRegression):
+        raise ValueError("The final step must be a LinearRegression")
+
+    features = []
+    for name, transformer, columns in preprocessor.transformers_:
+        if transformer == "drop" or name == "remainder":
+            continue
+        steps = transformer.steps if isinstance(transformer, Pipeline) else [(name, transformer)]
+        nodes = [_export_step(step) for _, step in steps]
+        # Branches that start with a numeric imputer take float inputs; everything else is categorical
+        dtype = nodes[0].get("dtype", "category")
+        features.append({"name": name, "columns": list(columns), "dtype": dtype, "steps": nodes})
+
+    return {
+        "format": GRAPH_FORMAT,
+        "version": GRAPH_VERSION,
+        "inputs": [c for f in features for c in f["columns"]],
+        "features": features,
+        "output": {"op": "Linear", "coef": _plain(model.coef_), "intercept": float(model.intercept_)},
+    }
+
+
+def check_parity(clf, graph_model, X):
+    """Largest absolute difference between clf.predict and the graph runtime on X."""
+    records = X.to_dict("records")
+    return float(np.max(np.abs(clf.predict(X) - graph_model.predict(records))))
+
+
+def save_graph(clf, path, X, atol=1e-6):
+    """Export clf and write the graph, unless its predictions on X differ by more than atol.
+
+    The check runs on the serialized graph, so the file that gets written is
+    exactly what was verified.
+    """
+    text = json.dumps(export_pipeline(clf), indent=2)
+    max_diff = check_parity(clf, GraphModel(json.loads(text)), X)
+    if max_diff > atol:
+        raise ValueError(f"Graph predictions differ from the pipeline by {max_diff:.3g} (atol={atol})")
+    with open(path, "w") as f:
+        f.write(text)
+    return path, max_diff
+
+
+def graph_path_for(model_path):
+    """Place the graph next to the model artifact, e.g. model.pkl -> model.json."""
+    base = model_path[:-4] if model_path.endswith(".pkl") else model_path
+    return base + ".json"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the trained pipeline as a NumPy inference graph.")
+    parser.add_argument("--model-path", default="salary_prediction_model.pkl", help="Fitted pipeline to export")
+    parser.add_argument("-o", "--output", help="Graph file (default: model path with .json)")
+    parser.add_argument("--data", default="Salary_Data.csv", help="Rows used for the parity check")
+    parser.add_argument("--atol", type=float, default=1e-6, help="Maximum allowed prediction difference")
+    args = parser.parse_args()
+
+    clf = joblib.load(args.model_path)
+    X, _ = load_dataset(args.data)
+    try:
+        output, max_diff = save_graph(clf, args.output or graph_path_for(args.model_path), X, args.atol)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ Inference graph saved as {output} (max |clf.predict - graph| = {max_diff:.3g})")
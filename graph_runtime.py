@@ -0,0 +1,88 @@
+import json
+import math
+import numpy as np
+
+GRAPH_FORMAT = "salary-inference-graph"
+GRAPH_VERSION = 1
+
+
+def _is_nan(value):
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _impute(values, node):
+    if node["dtype"] == "float":
+        out = np.array(values, dtype=np.float64)
+        fill = np.array(node["values"], dtype=np.float64)
+        return np.where(np.isnan(out), fill, out)
+    # Like SimpleImputer(missing_values=np.nan) on object columns, only NaN is
+    # imputed; None is left alone and later encodes as an unknown category
+    return [[fill if _is_nan(v) else v for v, fill in zip(row, node["values"])] for row in values]
+
+
+def _one_hot(values, node):
+    widths = [len(c) for c in node["categories"]]
+    offsets = np.cumsum([0] + widths[:-1])
+    lookups = [{c: i for i, c in enumerate(cats)} for cats in node["categories"]]
+    out = np.zeros((len(values), sum(widths)), dtype=np.float64)
+    for r, row in enumerate(values):
+        for j, v in enumerate(row):
+            i = lookups[j].get(v)
+            if i is not None:  # unknown categories encode as all zeros
+                out[r, offsets[j] + i] = 1.0
+    return out
+
+
+def _ordinal(values, node):
+    lookups = [{c: i for i, c in enumerate(cats)} for cats in node["categories"]]
+    unknown = node["unknown_value"]
+    return np.array([[lookups[j].get(v, unknown) for j, v in enumerate(row)] for row in values],
+                    dtype=np.float64)
+
+
+OPS = {
+    "Impute": _impute,
+    "OneHot": _one_hot,
+    "Ordinal": _ordinal,
+}
+
+
+def _to_float(value):
+    return math.nan if value is None else float(value)
+
+
+class GraphModel:
+    """Runs an exported inference graph with NumPy only.
+
+    ``predict`` takes a list of records (dicts keyed by input column) and
+    returns a NumPy array of predictions, mirroring ``Pipeline.predict``.
+    """
+
+    def __init__(self, graph):
+        if graph.get("format") != GRAPH_FORMAT or graph.get("version") != GRAPH_VERSION:
+            raise ValueError(f"Unsupported graph: {graph.get('format')} v{graph.get('version')}")
+        self.graph = graph
+        self.inputs = graph["inputs"]
+        output = graph["output"]
+        self.coef = np.array(output["coef"], dtype=np.float64)
+        self.intercept = float(output["intercept"])
+
+    def transform(self, records):
+        blocks = []
+        for branch in self.graph["features"]:
+            if branch["dtype"] == "float":
+                values = [[_to_float(r[c]) for c in branch["columns"]] for r in records]
+            else:
+                values = [[r[c] for c in branch["columns"]] for r in records]
+            for node in branch["steps"]:
+                values = OPS[node["op"]](values, node)
+            blocks.append(np.asarray(values, dtype=np.float64).reshape(len(records), -1))
+        return np.hstack(blocks)
+
+    def predict(self, records):
+        return self.transform(records) @ self.coef + self.intercept
+
+
+def load_graph(path):
+    with open(path) as f:
+        return GraphModel(json.load(f))
@@ -1,34 +1,105 @@
+import argparse
+import cProfile
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import mean_squared_error, r2_score
 from sklearn.linear_model import LinearRegression
 import numpy as np
 import joblib
 from data_processing import load_and_process_data
+from export_model import PARITY_SAMPLE_ROWS, save_graph, graph_path_for
+from profiling import StageProfiler, fit_pipeline_with_profiling, profile_path_for
 
-# Load and preprocess data
-file_path = "Salary_Data.csv"
-X_train, X_test, y_train, y_test, preprocessor = load_and_process_data(file_path)
 
-# Define model (only Linear Regression)
-model = LinearRegression()
+def _memory_pass(file_path):
+    """Repeat data loading and fitting under tracemalloc to get per-stage peaks."""
+    profiler = StageProfiler(trace_memory=True)
+    X_train, X_test, y_train, _, preprocessor = load_and_process_data(file_path, profiler.stage)
+    clf = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())])
+    fit_pipeline_with_profiling(clf, X_train, y_train, profiler)
+    with profiler.stage("evaluate.predict"):
+        clf.predict(X_test)
+    return profiler
 
-# Build pipeline
-clf = Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
 
-# Train model
-clf.fit(X_train, y_train)
+def train_model(file_path="Salary_Data.csv", model_path="salary_prediction_model.pkl",
+                profile=False, cprofile_path=None, profile_memory=False):
+    profile = profile or profile_memory
+    profiler = StageProfiler(enabled=profile)
+    pr = cProfile.Profile() if cprofile_path else None
+    if pr:
+        pr.enable()
 
-# Predictions
-preds = clf.predict(X_test)
+    # Load and preprocess data
+    X_train, X_test, y_train, y_test, preprocessor = load_and_process_data(file_path, profiler.stage)
 
-# Evaluate
-rmse = np.sqrt(mean_squared_error(y_test, preds))
-r2 = r2_score(y_test, preds)
+    # Define model (only Linear Regression)
+    model = LinearRegression()
 
-print("📊 Linear Regression Results")
-print(f"   RMSE: {rmse:.2f}")
-print(f"   R2 Score: {r2:.3f}")
+    # Build pipeline
+    clf = Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
 
-# Save model
-joblib.dump(clf, "salary_prediction_model.pkl")
-print("✅ Model saved as salary_prediction_model.pkl")
+    # Train model
+    if profile:
+        fit_pipeline_with_profiling(clf, X_train, y_train, profiler)
+    else:
+        clf.fit(X_train, y_train)
+
+    # Predictions
+    with profiler.stage("evaluate.predict"):
+        preds = clf.predict(X_test)
+
+    if pr:
+        pr.disable()
+        pr.dump_stats(cprofile_path)
+        print(f"🔎 cProfile stats written to {cprofile_path}")
+
+    # Evaluate
+    rmse = np.sqrt(mean_squared_error(y_test, preds))
+    r2 = r2_score(y_test, preds)
+
+    print("📊 Linear Regression Results")
+    print(f"   RMSE: {rmse:.2f}")
+    print(f"   R2 Score: {r2:.3f}")
+
+    # Save model
+    with profiler.stage("save_model"):
+        joblib.dump(clf, model_path)
+    print(f"✅ Model saved as {model_path}")
+
+    # Export the NumPy inference graph used for serving, checked against clf on test rows
+    with profiler.stage("export_graph"):
+        graph_path, max_diff = save_graph(clf, graph_path_for(model_path), X_test.head(PARITY_SAMPLE_ROWS))
+    print(f"✅ Inference graph saved as {graph_path} (max |clf.predict - graph| = {max_diff:.3g})")
+
+    if profile_memory:
+        profiler.add_memory(_memory_pass(file_path))
+
+    if profile:
+        profiler.print_summary()
+        report_path = profiler.write_json(
+            profile_path_for(model_path),
+            data_file=file_path,
+            n_train_rows=len(X_train),
+            n_test_rows=len(X_test),
+            rmse=float(rmse),
+            r2=float(r2),
+            memory_traced=profile_memory,
+        )
+        print(f"📝 Profiling report written to {report_path}")
+
+    return clf, rmse, r2
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the salary prediction model.")
+    parser.add_argument("--data", default="Salary_Data.csv", help="Training CSV file")
+    parser.add_argument("--model-path", default="salary_prediction_model.pkl", help="Where to save the model")
+    parser.add_argument("--profile", action="store_true",
+                        help="Record per-stage timing and write a JSON report next to the model")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="Also record per-stage tracemalloc peaks in a separate pass (implies --profile)")
+    parser.add_argument("--cprofile", metavar="PATH", help="Dump cProfile stats of the training run to PATH")
+    args = parser.parse_args()
+
+    train_model(args.data, args.model_path, profile=args.profile, cprofile_path=args.cprofile,
+                profile_memory=args.profile_memory)
@@ -0,0 +1,267 @@
+import argparse
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+import pandas as pd
+import joblib
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LinearRegression
+from data_processing import build_preprocessor
+from export_model import PARITY_SAMPLE_ROWS, save_graph, graph_path_for
+
+TARGET = "Salary"
+
+
+def byte_ranges(file_path, block_size):
+    """Split a CSV into (start, end) byte ranges aligned to line boundaries.
+
+    The header line is excluded; every range starts at the beginning of a row.
+    """
+    size = os.path.getsize(file_path)
+    ranges = []
+    with open(file_path, "rb") as f:
+        f.readline()  # header
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + block_size, size))
+            if f.tell() < size:
+                f.readline()  # move to the end of the current row
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_schema(file_path, nrows=1000):
+    """Column dtypes taken from the head of the file.
+
+    Blocks are parsed without a header, so pinning dtypes keeps a block whose
+    categorical column happens to be all-missing from being read as float.
+    """
+    head = pd.read_csv(file_path, nrows=nrows)
+    return {
+        col: "float64" if pd.api.types.is_numeric_dtype(dtype) else "object"
+        for col, dtype in head.dtypes.items()
+    }
+
+
+def _transform(preprocessor, df):
+    Xt = preprocessor.transform(df.drop(TARGET, axis=1))
+    if hasattr(Xt, "toarray"):
+        Xt = Xt.toarray()
+    return np.asarray(Xt, dtype=np.float64), df[TARGET].to_numpy(dtype=np.float64)
+
+
+def sufficient_statistics(X, y):
+    """Row count, means and centered cross-products (X^T X, X^T y) of one block."""
+    n = X.shape[0]
+    x_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    Xc = X - x_mean
+    return {
+        "n": n,
+        "x_mean": x_mean,
+        "y_mean": y_mean,
+        "xtx": Xc.T @ Xc,
+        "xty": Xc.T @ (y - y_mean),
+    }
+
+
+def merge_statistics(a, b):
+    """Combine two blocks' statistics (pairwise update, stable for large row counts)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    n = a["n"] + b["n"]
+    dx = b["x_mean"] - a["x_mean"]
+    dy = b["y_mean"] - a["y_mean"]
+    w = a["n"] * b["n"] / n
+    return {
+        "n": n,
+        "x_mean": a["x_mean"] + dx * b["n"] / n,
+        "y_mean": a["y_mean"] + dy * b["n"] / n,
+        "xtx": a["xtx"] + b["xtx"] + w * np.outer(dx, dx),
+        "xty": a["xty"] + b["xty"] + w * dx * dy,
+    }
+
+
+def _read_range(file_path, schema, byte_range):
+    start, end = byte_range
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        block = f.read(end - start)
+    df = pd.read_csv(io.BytesIO(block), header=None, names=list(schema), dtype=schema)
+    return df.dropna(subset=[TARGET])
+
+
+def _map_ranges(task, ranges, n_workers):
+    """Apply task to every byte range, in worker processes when n_workers > 1, in file order."""
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            yield from executor.map(task, ranges)
+    else:
+        for byte_range in ranges:
+            yield task(byte_range)
+
+
+def range_statistics(file_path, schema, preprocessor, byte_range):
+    """Read one byte range of the CSV and return its sufficient statistics."""
+    df = _read_range(file_path, schema, byte_range)
+    if df.empty:
+        return None
+    return sufficient_statistics(*_transform(preprocessor, df))
+
+
+def range_value_counts(file_path, schema, byte_range):
+    """Per-column value counts (missing values excluded) of one byte range."""
+    df = _read_range(file_path, schema, byte_range)
+    return {col: df[col].value_counts() for col in schema if col != TARGET}
+
+
+def merge_value_counts(a, b):
+    if a is None:
+        return b
+    return {col: a[col].add(b[col], fill_value=0) for col in a}
+
+
+def solve_normal_equations(stats, rcond=1e-10):
+    """Least-squares coefficients and intercept from accumulated statistics.
+
+    X^T X is first scaled to unit diagonal, so the rank cutoff does not depend
+    on the row count or on the range of the widest feature (a one-hot column
+    set on a handful of rows would otherwise be cut to zero). Directions in
+    the null space (e.g. collinear one-hot columns) are then projected out in
+    the original coordinates, giving the same minimum-norm solution
+    LinearRegression produces.
+    """
+    xtx, xty = stats["xtx"], stats["xty"]
+    scale = np.sqrt(np.diag(xtx))
+    scale[scale == 0] = 1.0
+
+    eigvals, eigvecs = np.linalg.eigh(xtx / np.outer(scale, scale))
+    keep = eigvals > rcond * eigvals.max()
+    kept = eigvecs[:, keep]
+    coef = kept @ ((kept.T @ (xty / scale)) / eigvals[keep]) / scale
+
+    if not keep.all():
+        # Null space of the unscaled X^T X is D^-1 times that of the scaled one
+        null_basis, _ = np.linalg.qr(eigvecs[:, ~keep] / scale[:, None])
+        coef -= null_basis @ (null_basis.T @ coef)
+
+    intercept = stats["y_mean"] - stats["x_mean"] @ coef
+    return coef, intercept
+
+
+def _median_from_counts(counts):
+    """Median of the values described by a value_counts Series."""
+    if counts.empty:
+        return np.nan
+    counts = counts.sort_index()
+    cumulative = counts.cumsum().to_numpy()
+    n = cumulative[-1]
+    lower = counts.index[np.searchsorted(cumulative, (n - 1) // 2 + 1)]
+    upper = counts.index[np.searchsorted(cumulative, n // 2 + 1)]
+    return (lower + upper) / 2
+
+
+def _most_frequent_from_counts(counts):
+    """Most frequent value, smallest one on ties (as SimpleImputer does)."""
+    return min(counts.index[counts == counts.max()])
+
+
+def fit_preprocessor_streamed(file_path, schema, ranges, n_workers=1):
+    """Fit the preprocessor from value counts collected over the whole file.
+
+    A first pass over the byte ranges collects every column's value counts, so
+    categories that only appear late in an ordered file are still known. The
+    preprocessor is then fit on a small summary frame with the same median,
+    most frequent value and category set as the full data.
+    """
+    counts = None
+    task = partial(range_value_counts, file_path, schema)
+    for block_counts in _map_ranges(task, ranges, n_workers):
+        counts = merge_value_counts(counts, block_counts)
+
+    categorical = [col for col in counts if schema[col] == "object"]
+    n_rows = max([len(counts[col]) for col in categorical] + [0]) + 1
+
+    summary = {}
+    for col, col_counts in counts.items():
+        if col in categorical:
+            # Every category once, padded with the mode so it stays the most frequent
+            mode = _most_frequent_from_counts(col_counts)
+            categories = sorted(col_counts.index)
+            summary[col] = categories + [mode] * (n_rows - len(categories))
+        else:
+            summary[col] = [_median_from_counts(col_counts)] * n_rows
+
+    preprocessor = build_preprocessor()
+    preprocessor.fit(pd.DataFrame(summary, columns=list(counts)))
+    return preprocessor
+
+
+def train_out_of_core(file_path, preprocessor=None, block_size=32 * 1024 ** 2, n_workers=1):
+    """Fit preprocessor + LinearRegression without loading the whole CSV.
+
+    The CSV is split into byte ranges of about block_size bytes. Each range is
+    pushed through the fitted preprocessor and reduced to X^T X / X^T y, so
+    memory grows with the feature width, not the row count. Ranges are
+    processed in worker processes when n_workers > 1 and merged in file order.
+    Without a preprocessor, an extra streamed pass fits one on the whole file.
+    """
+    schema = read_schema(file_path)
+    ranges = byte_ranges(file_path, block_size)
+    if preprocessor is None:
+        preprocessor = fit_preprocessor_streamed(file_path, schema, ranges, n_workers)
+
+    stats = None
+    task = partial(range_statistics, file_path, schema, preprocessor)
+    for block_stats in _map_ranges(task, ranges, n_workers):
+        stats = merge_statistics(stats, block_stats)
+
+    if stats is None:
+        raise ValueError(f"No rows with a {TARGET} value found in {file_path}")
+
+    coef, intercept = solve_normal_equations(stats)
+
+    model = LinearRegression()
+    model.coef_ = coef
+    model.intercept_ = intercept
+    model.n_features_in_ = coef.shape[0]
+
+    clf = Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
+    return clf, stats["n"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the salary model out of core from a large CSV.")
+    parser.add_argument("--data", default="Salary_Data.csv", help="Training CSV file")
+    parser.add_argument("--model-path", default="salary_prediction_model.pkl", help="Where to save the model")
+    parser.add_argument("--preprocessor-from", metavar="PKL",
+                        help="Reuse the fitted preprocessor of an existing model instead of fitting it in a streamed pass")
+    parser.add_argument("--block-mb", type=float, default=32, help="Approximate size of each CSV block in MB")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    args = parser.parse_args()
+
+    preprocessor = None
+    if args.preprocessor_from:
+        preprocessor = joblib.load(args.preprocessor_from).named_steps["preprocessor"]
+
+    clf, n_rows = train_out_of_core(
+        args.data,
+        preprocessor=preprocessor,
+        block_size=int(args.block_mb * 1024 ** 2),
+        n_workers=args.workers,
+    )
+    print(f"📊 Trained on {n_rows} rows out of core")
+
+    joblib.dump(clf, args.model_path)
+    print(f"✅ Model saved as {args.model_path}")
+
+    # Parity check on the head of the file; the graph is not written if it fails
+    sample = pd.read_csv(args.data, nrows=PARITY_SAMPLE_ROWS).dropna(subset=[TARGET]).drop(TARGET, axis=1)
+    graph_path, max_diff = save_graph(clf, graph_path_for(args.model_path), sample)
+    print(f"✅ Inference graph saved as {graph_path} (max |clf.predict - graph| = {max_diff:.3g})")
@@ -1,22 +1,20 @@
-import joblib
-import pandas as pd
+from graph_runtime import load_graph
 
 def predict_salary(age, gender, education, job_title, experience):
-    # Load trained model
-    model = joblib.load("salary_prediction_model.pkl")
+    # Load exported inference graph
+    model = load_graph("salary_prediction_model.json")
 
-    # Create input DataFrame
+    # Create input record
     sample = {
-        "Age": [age],
-        "Gender": [gender],
-        "Education Level": [education],
-        "Job Title": [job_title],
-        "Years of Experience": [experience]
+        "Age": age,
+        "Gender": gender,
+        "Education Level": education,
+        "Job Title": job_title,
+        "Years of Experience": experience
     }
-    sample_df = pd.DataFrame(sample)
 
     # Predict salary
-    prediction = model.predict(sample_df)
+    prediction = model.predict([sample])
     return prediction[0]
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module
+    resource = None
+
+
+def _max_rss_mb():
+    """Peak resident set size of this process so far in MB, or None if unavailable."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return max_rss / 1024 ** 2 if sys.platform == "darwin" else max_rss / 1024
+
+
+class StageProfiler:
+    """Collects wall time and memory growth for named training stages.
+
+    By default stages are timed with tracemalloc off, since tracing slows
+    allocation-heavy stages far more than others. With trace_memory=True each
+    stage also records its tracemalloc peak; run that as a separate pass and
+    fold it into the timing profiler with add_memory.
+    """
+
+    def __init__(self, enabled=True, trace_memory=False):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            start_current, _ = tracemalloc.get_traced_memory()
+        rss_before = _max_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = {"stage": name, "seconds": round(elapsed, 6)}
+            if rss_before is not None:
+                # Growth of the process high-water mark during this stage
+                entry["rss_increase_mb"] = round(_max_rss_mb() - rss_before, 3)
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                if started_tracing:
+                    tracemalloc.stop()
+                entry["peak_memory_mb"] = round(max(peak - start_current, 0) / 1024 ** 2, 3)
+            self.stages.append(entry)
+
+    def add_memory(self, memory_profiler):
+        """Copy tracemalloc peaks from a trace_memory profiler onto matching stages."""
+        peaks = {s["stage"]: s["peak_memory_mb"] for s in memory_profiler.stages}
+        for s in self.stages:
+            if s["stage"] in peaks:
+                s["peak_memory_mb"] = peaks[s["stage"]]
+
+    def report(self, **extra):
+        total = sum(s["seconds"] for s in self.stages)
+        max_rss = _max_rss_mb()
+        report = {
+            "total_seconds": round(total, 6),
+            "max_rss_mb": None if max_rss is None else round(max_rss, 3),
+            "stages": self.stages,
+        }
+        report.update(extra)
+        return report
+
+    def write_json(self, path, **extra):
+        with open(path, "w") as f:
+            json.dump(self.report(**extra), f, indent=2)
+        return path
+
+    def print_summary(self):
+        total = sum(s["seconds"] for s in self.stages) or 1.0
+        print("⏱️  Training stage timings")
+        for s in self.stages:
+            share = 100 * s["seconds"] / total
+            memory = f"  peak {s['peak_memory_mb']:.2f} MB" if "peak_memory_mb" in s else ""
+            print(f"   {s['stage']:<36} {s['seconds']:>9.4f}s {share:5.1f}%{memory}")
+
+
+def fit_pipeline_with_profiling(pipeline, X, y, profiler):
+    """Fit a Pipeline step by step so each step gets its own timing entry.
+
+    Equivalent to ``pipeline.fit(X, y)``: every intermediate step is
+    fit_transform'ed in order and the final estimator is fit on the result.
+    """
+    Xt = X
+    for name, step in pipeline.steps[:-1]:
+        with profiler.stage(f"pipeline.{name}.fit_transform"):
+            Xt = step.fit_transform(Xt, y)
+
+    name, final = pipeline.steps[-1]
+    with profiler.stage(f"pipeline.{name}.fit"):
+        final.fit(Xt, y)
+    return pipeline
+
+
+def profile_path_for(model_path, suffix=".profile.json"):
+    """Place the report next to the model artifact, e.g. model.pkl -> model.profile.json."""
+    base = model_path[:-4] if model_path.endswith(".pkl") else model_path
+    return base + suffix
@@ -0,0 +1,36 @@
+import argparse
+import numpy as np
+import pandas as pd
+
+
+def generate_synthetic_data(n_rows, source_path="Salary_Data.csv", seed=42):
+    """Scale the salary dataset to n_rows by resampling rows with small numeric jitter.
+
+    Categorical columns keep their original distribution (and missing values),
+    so the result exercises the same preprocessing paths as the real data.
+    """
+    rng = np.random.default_rng(seed)
+    source = pd.read_csv(source_path)
+
+    idx = rng.integers(0, len(source), size=n_rows)
+    df = source.iloc[idx].reset_index(drop=True)
+
+    # Jitter numeric columns so the rows are not exact duplicates
+    df["Age"] = (df["Age"] + rng.integers(-2, 3, size=n_rows)).clip(lower=18)
+    df["Years of Experience"] = (df["Years of Experience"] + rng.normal(0, 0.5, size=n_rows)).clip(lower=0).round(1)
+    df["Salary"] = (df["Salary"] * rng.normal(1.0, 0.05, size=n_rows)).round(0)
+
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a scaled-up synthetic salary dataset.")
+    parser.add_argument("rows", type=int, help="Number of rows to generate")
+    parser.add_argument("-o", "--output", help="Output CSV (default: Salary_Data_<rows>.csv)")
+    parser.add_argument("--source", default="Salary_Data.csv", help="CSV to sample from")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    output = args.output or f"Salary_Data_{args.rows}.csv"
+    generate_synthetic_data(args.rows, args.source, args.seed).to_csv(output, index=False)
+    print(f"✅ Wrote {args.rows} rows to {output}")
@@ -0,0 +1,96 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+# Add the parent directory to the path so we can import the evaluation module
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from evaluation import evaluate_model, grouped_metrics, row_bootstrap_interval
+
+MODEL_PATH = os.path.join(parent_dir, "salary_prediction_model.pkl")
+DATA_PATH = os.path.join(parent_dir, "Salary_Data.csv")
+
+
+class TestEvaluation(unittest.TestCase):
+    """Test cases for the resampling evaluation harness."""
+
+    def test_grouped_metrics_matches_per_group_loop(self):
+        """Test that vectorized metrics agree with computing each group separately."""
+        rng = np.random.default_rng(0)
+        group = rng.integers(0, 3, size=200)
+        y_true = rng.normal(100, 10, size=200)
+        y_pred = y_true + rng.normal(0, 5, size=200)
+
+        rmse, r2, count = grouped_metrics(group, y_true, y_pred, 4)
+
+        for g in range(3):
+            mask = group == g
+            err = y_true[mask] - y_pred[mask]
+            self.assertAlmostEqual(rmse[g], np.sqrt(np.mean(err ** 2)))
+            sst = np.sum((y_true[mask] - y_true[mask].mean()) ** 2)
+            self.assertAlmostEqual(r2[g], 1 - np.sum(err ** 2) / sst)
+        self.assertEqual(count[3], 0)
+        self.assertTrue(np.isnan(rmse[3]))
+
+    def test_row_bootstrap_independent_of_batch_budget(self):
+        """Test that the element budget only changes batching, not the interval."""
+        rng = np.random.default_rng(0)
+        y = pd.Series(rng.normal(100, 10, size=500))
+        row_index = np.tile(np.arange(500), 2)
+        preds = y.to_numpy()[row_index] + rng.normal(0, 5, size=1000)
+
+        small = row_bootstrap_interval(y, row_index, preds, 0.95, seed=1, n_resamples=50, max_elements=500)
+        large = row_bootstrap_interval(y, row_index, preds, 0.95, seed=1, n_resamples=50)
+        self.assertEqual(small, large)
+
+    def test_report_structure(self):
+        """Test that the report has confidence intervals and segment errors."""
+        report = evaluate_model(MODEL_PATH, DATA_PATH, n_repeats=2, n_splits=3,
+                                n_bootstrap=3, n_workers=1)
+
+        for kind in ("kfold", "bootstrap"):
+            self.assertIn(kind, report)
+            ci = report[kind]["rmse"]
+            self.assertLessEqual(ci["low"], ci["mean"])
+            self.assertLessEqual(ci["mean"], ci["high"])
+            self.assertIn("Education Level", report[kind]["segments"])
+            self.assertIn("Job Title", report[kind]["segments"])
+
+    def test_kfold_reports_repeat_spread_separately(self):
+        """Test that K-fold repeats are a spread and its CI comes from resampling rows."""
+        report = evaluate_model(MODEL_PATH, DATA_PATH, n_repeats=3, n_splits=3,
+                                n_bootstrap=0, n_workers=1)
+        kfold = report["kfold"]
+
+        repeats = kfold["repeat_spread"]["rmse"]
+        self.assertNotIn("low", repeats)
+        self.assertLessEqual(repeats["min"], repeats["max"])
+        # Resampling rows gives a much wider interval than re-splitting folds
+        self.assertGreater(kfold["rmse"]["high"] - kfold["rmse"]["low"], repeats["max"] - repeats["min"])
+        self.assertIn("min", kfold["segments"]["Job Title"][0])
+
+    def test_small_segments_are_skipped(self):
+        """Test that segments below the minimum row count are left out and counted."""
+        report = evaluate_model(MODEL_PATH, DATA_PATH, n_repeats=0, n_bootstrap=3,
+                                n_workers=1, min_segment_rows=20)
+        bootstrap = report["bootstrap"]
+
+        for segment in bootstrap["segments"]["Job Title"]:
+            self.assertGreaterEqual(segment["n_rows"], 20)
+            self.assertGreater(segment["n_predictions"], 0)
+        self.assertGreater(bootstrap["small_segments_skipped"]["Job Title"], 0)
+
+    def test_results_independent_of_worker_count(self):
+        """Test that seeded resamples give identical results in a process pool."""
+        serial = evaluate_model(MODEL_PATH, DATA_PATH, n_repeats=2, n_splits=3,
+                                n_bootstrap=2, n_workers=1)
+        parallel = evaluate_model(MODEL_PATH, DATA_PATH, n_repeats=2, n_splits=3,
+                                  n_bootstrap=2, n_workers=2)
+        self.assertEqual(serial, parallel)
+
+
+if __name__ == '__main__':
+    unittest.main()
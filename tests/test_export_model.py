@@ -0,0 +1,101 @@
+import unittest
+import json
+import os
+import sys
+import numpy as np
+import pandas as pd
+import tempfile
+import shutil
+from unittest.mock import patch
+import joblib
+from sklearn.base import clone
+
+# Add the parent directory to the path so we can import the export modules
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from data_processing import load_dataset
+from export_model import check_parity, export_pipeline, save_graph
+from graph_runtime import GraphModel, load_graph
+
+MODEL_PATH = os.path.join(parent_dir, "salary_prediction_model.pkl")
+GRAPH_PATH = os.path.join(parent_dir, "salary_prediction_model.json")
+DATA_PATH = os.path.join(parent_dir, "Salary_Data.csv")
+
+
+class TestGraphExport(unittest.TestCase):
+    """Test cases for the exported inference graph and its NumPy runtime."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.clf = joblib.load(MODEL_PATH)
+        cls.graph = GraphModel(export_pipeline(cls.clf))
+
+    def test_parity_on_training_data(self):
+        """Test that the runtime matches clf.predict on every dataset row."""
+        X, _ = load_dataset(DATA_PATH)
+        self.assertLess(check_parity(self.clf, self.graph, X), 1e-6)
+
+    def test_parity_on_unknown_and_missing_values(self):
+        """Test unseen categories and missing values against the pipeline."""
+        records = [
+            {"Age": None, "Gender": None, "Education Level": None,
+             "Job Title": None, "Years of Experience": None},
+            {"Age": 40, "Gender": "Unknown", "Education Level": "Diploma",
+             "Job Title": "Astronaut", "Years of Experience": 12},
+        ]
+        expected = self.clf.predict(pd.DataFrame(records))
+        np.testing.assert_allclose(self.graph.predict(records), expected, rtol=1e-9)
+
+    def test_committed_graph_matches_model(self):
+        """Test that the served graph file was exported from the committed model."""
+        with open(GRAPH_PATH) as f:
+            self.assertEqual(json.load(f), json.loads(json.dumps(export_pipeline(self.clf))))
+
+    def test_rejects_unsupported_encoder_settings(self):
+        """Test that encoder options the runtime does not implement fail at export."""
+        X, y = load_dataset(DATA_PATH)
+        for params in ({"preprocessor__cat_high__ordinal__min_frequency": 20},
+                       {"preprocessor__cat_low__onehot__max_categories": 3},
+                       {"preprocessor__cat_high__ordinal__encoded_missing_value": -2},
+                       {"preprocessor__cat_high__ordinal__handle_unknown": "error",
+                        "preprocessor__cat_high__ordinal__unknown_value": None}):
+            with self.subTest(params=params):
+                clf = clone(self.clf).set_params(**params).fit(X, y)
+                with self.assertRaises(ValueError):
+                    export_pipeline(clf)
+
+    def test_save_graph_checks_parity(self):
+        """Test that a graph that does not match clf is never written."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        X, _ = load_dataset(DATA_PATH)
+
+        path, max_diff = save_graph(self.clf, os.path.join(tmp_dir, "ok.json"), X)
+        self.assertTrue(os.path.exists(path))
+        self.assertLess(max_diff, 1e-6)
+
+        broken = export_pipeline(self.clf)
+        broken["output"]["intercept"] += 1000
+        bad_path = os.path.join(tmp_dir, "bad.json")
+        with patch('export_model.export_pipeline', return_value=broken):
+            with self.assertRaises(ValueError):
+                save_graph(self.clf, bad_path, X)
+        self.assertFalse(os.path.exists(bad_path))
+
+    def test_rejects_unknown_format(self):
+        """Test that loading a graph of another format fails clearly."""
+        with self.assertRaises(ValueError):
+            GraphModel({"format": "other", "version": 1})
+
+    def test_load_graph(self):
+        """Test loading the graph file from disk."""
+        graph = load_graph(GRAPH_PATH)
+        sample = {"Age": 28, "Gender": "Female", "Education Level": "Master's",
+                  "Job Title": "Data Analyst", "Years of Experience": 3}
+        self.assertAlmostEqual(graph.predict([sample])[0],
+                               self.clf.predict(pd.DataFrame([sample]))[0], places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+import numpy as np
+import pandas as pd
+
+# Add the parent directory to the path so we can import the training modules
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LinearRegression
+from data_processing import build_preprocessor, load_and_process_data
+from out_of_core_training import byte_ranges, solve_normal_equations, sufficient_statistics, train_out_of_core
+
+DATA_PATH = os.path.join(parent_dir, "Salary_Data.csv")
+
+
+class TestOutOfCoreTraining(unittest.TestCase):
+    """Test cases for the streamed normal-equations trainer."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        X_train, cls.X_test, y_train, _, preprocessor = load_and_process_data(DATA_PATH)
+        cls.clf = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())])
+        cls.clf.fit(X_train, y_train)
+
+        cls.train_path = os.path.join(cls.tmp_dir, "train.csv")
+        X_train.assign(Salary=y_train).to_csv(cls.train_path, index=False)
+        cls.n_train = len(X_train)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def test_byte_ranges_cover_file(self):
+        """Test that byte ranges are contiguous and end at the file size."""
+        ranges = byte_ranges(self.train_path, 4096)
+        self.assertGreater(len(ranges), 1)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.train_path))
+
+    def test_matches_in_memory_linear_regression(self):
+        """Test that streamed training reproduces the in-memory pipeline."""
+        preprocessor = self.clf.named_steps["preprocessor"]
+        ooc, n_rows = train_out_of_core(self.train_path, preprocessor=preprocessor, block_size=16384)
+
+        self.assertEqual(n_rows, self.n_train)
+        np.testing.assert_allclose(ooc.predict(self.X_test), self.clf.predict(self.X_test), rtol=1e-6)
+
+    def test_rare_category_at_scale(self):
+        """Test that a one-hot column set on two of 2M rows keeps its coefficient."""
+        rng = np.random.default_rng(0)
+        n = 2000000
+        ordinal = rng.integers(0, 5000, n).astype(float)
+        rare = np.zeros(n)
+        rare[:2] = 1
+        onehot = rng.integers(0, 2, n).astype(float)
+        X = np.column_stack([ordinal, rare, onehot, 1 - onehot])  # last two are collinear
+        y = 3 * ordinal + 40000 * rare + 1000 * onehot + rng.normal(0, 100, n)
+
+        coef, intercept = solve_normal_equations(sufficient_statistics(X, y))
+        expected = LinearRegression().fit(X, y)
+
+        np.testing.assert_allclose(coef, expected.coef_, rtol=1e-6)
+        self.assertAlmostEqual(intercept, expected.intercept_, places=4)
+
+    def test_parallel_matches_serial(self):
+        """Test that worker processes give the same model as a single process."""
+        preprocessor = self.clf.named_steps["preprocessor"]
+        serial, _ = train_out_of_core(self.train_path, preprocessor=preprocessor, block_size=16384)
+        parallel, _ = train_out_of_core(self.train_path, preprocessor=preprocessor, block_size=16384, n_workers=2)
+
+        np.testing.assert_allclose(parallel.named_steps["model"].coef_, serial.named_steps["model"].coef_)
+
+    def test_fits_preprocessor_on_whole_ordered_file(self):
+        """Test that categories only present at the end of a sorted file are learned."""
+        df = pd.read_csv(DATA_PATH).dropna(subset=["Salary"]).sort_values("Job Title")
+        sorted_path = os.path.join(self.tmp_dir, "sorted.csv")
+        df.to_csv(sorted_path, index=False)
+
+        X, y = df.drop("Salary", axis=1), df["Salary"]
+        expected = Pipeline(steps=[("preprocessor", build_preprocessor()), ("model", LinearRegression())])
+        expected.fit(X, y)
+
+        ooc, n_rows = train_out_of_core(sorted_path, block_size=16384, n_workers=2)
+
+        self.assertEqual(n_rows, len(df))
+        expected_ordinal = expected.named_steps["preprocessor"].named_transformers_["cat_high"]
+        ooc_ordinal = ooc.named_steps["preprocessor"].named_transformers_["cat_high"]
+        np.testing.assert_array_equal(ooc_ordinal["ordinal"].categories_[0], expected_ordinal["ordinal"].categories_[0])
+        np.testing.assert_allclose(ooc.predict(self.X_test), expected.predict(self.X_test), rtol=1e-6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+import shutil
+import tracemalloc
+from unittest.mock import patch
+import numpy as np
+
+# Add the parent directory to the path so we can import the training modules
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from data_processing import load_and_process_data
+from model_training import train_model
+from profiling import StageProfiler, profile_path_for
+from synthetic_data import generate_synthetic_data
+
+DATA_PATH = os.path.join(parent_dir, "Salary_Data.csv")
+
+
+class TestTrainingProfiling(unittest.TestCase):
+    """Test cases for training-time stage profiling."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_stage_profiler_records_stages(self):
+        """Test that stages are timed without tracemalloc running."""
+        profiler = StageProfiler()
+        with profiler.stage("alloc"):
+            self.assertFalse(tracemalloc.is_tracing())
+            _ = [0] * 100000
+
+        report = profiler.report()
+        self.assertEqual([s["stage"] for s in report["stages"]], ["alloc"])
+        self.assertGreaterEqual(report["stages"][0]["seconds"], 0)
+        self.assertNotIn("peak_memory_mb", report["stages"][0])
+
+    def test_memory_profiler_peaks_merge_into_timings(self):
+        """Test that a trace_memory pass adds peaks to the matching timed stages."""
+        timing = StageProfiler()
+        memory = StageProfiler(trace_memory=True)
+        for profiler in (timing, memory):
+            with profiler.stage("alloc"):
+                _ = [0] * 100000
+
+        timing.add_memory(memory)
+        self.assertGreater(timing.stages[0]["peak_memory_mb"], 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_disabled_profiler_records_nothing(self):
+        """Test that a disabled profiler is a no-op."""
+        profiler = StageProfiler(enabled=False)
+        load_and_process_data(DATA_PATH, profiler.stage)
+        self.assertEqual(profiler.stages, [])
+
+    def test_profile_path_for(self):
+        """Test that the report is placed next to the model artifact."""
+        self.assertEqual(profile_path_for("out/model.pkl"), "out/model.profile.json")
+
+    def test_train_model_writes_report(self):
+        """Test that profiled training writes a JSON report covering every stage."""
+        model_path = os.path.join(self.tmp_dir, "model.pkl")
+        cprofile_path = os.path.join(self.tmp_dir, "train.prof")
+        train_model(DATA_PATH, model_path, profile=True, cprofile_path=cprofile_path)
+
+        self.assertTrue(os.path.exists(cprofile_path))
+        with open(profile_path_for(model_path)) as f:
+            report = json.load(f)
+
+        stages = [s["stage"] for s in report["stages"]]
+        for expected in ["data.read_csv", "data.dropna", "data.train_test_split",
+                         "pipeline.preprocessor.fit_transform", "pipeline.model.fit", "export_graph"]:
+            self.assertIn(expected, stages)
+        self.assertIn("rmse", report)
+        self.assertIn("max_rss_mb", report)
+        self.assertFalse(report["memory_traced"])
+
+    def test_train_model_profile_memory(self):
+        """Test that --profile-memory adds tracemalloc peaks from a separate pass."""
+        model_path = os.path.join(self.tmp_dir, "model.pkl")
+        train_model(DATA_PATH, model_path, profile_memory=True)
+
+        with open(profile_path_for(model_path)) as f:
+            report = json.load(f)
+        stages = {s["stage"]: s for s in report["stages"]}
+        self.assertTrue(report["memory_traced"])
+        self.assertIn("peak_memory_mb", stages["pipeline.preprocessor.fit_transform"])
+
+    @patch('model_training.fit_pipeline_with_profiling')
+    def test_unprofiled_training_uses_pipeline_fit(self, mock_fit):
+        """Test that the step-by-step fit is only used when profiling."""
+        model_path = os.path.join(self.tmp_dir, "model.pkl")
+        train_model(DATA_PATH, model_path)
+
+        mock_fit.assert_not_called()
+        self.assertFalse(os.path.exists(profile_path_for(model_path)))
+
+    def test_generate_synthetic_data(self):
+        """Test that the synthetic generator scales the dataset reproducibly."""
+        df = generate_synthetic_data(500, DATA_PATH, seed=1)
+        again = generate_synthetic_data(500, DATA_PATH, seed=1)
+
+        self.assertEqual(len(df), 500)
+        self.assertListEqual(list(df.columns), list(again.columns))
+        self.assertTrue(np.allclose(df["Salary"].fillna(0), again["Salary"].fillna(0)))
+
+
+if __name__ == '__main__':
+    unittest.main()